@@ -1,5 +1,6 @@
 import numpy as np
-from ..trend import kama
+import pandas as pd
+from ..trend import kama_np
 
 
 def kama_market_regime(df, col,
@@ -43,15 +44,13 @@ def kama_market_regime(df, col,
     if col not in df.columns:
         raise ValueError(f"The required column '{col}' is not present in the DataFrame.")
 
-    df_copy = df.copy()
+    close_values = df[col].to_numpy(dtype=np.float64, copy=False)
 
     # Calculate both KAMA values
-    df_copy["kama_fast"] = kama(df_copy, col, l1=l1_fast, l2=l2_fast, l3=l3_fast)
-    df_copy["kama_slow"] = kama(df_copy, col, l1=l1_slow, l2=l2_slow, l3=l3_slow)
+    kama_fast = kama_np(close_values, l1=l1_fast, l2=l2_fast, l3=l3_fast)
+    kama_slow = kama_np(close_values, l1=l1_slow, l2=l2_slow, l3=l3_slow)
 
     # Difference & regime detection
-    df_copy["kama_diff"] = df_copy["kama_fast"] - df_copy["kama_slow"]
-    df_copy["kama_trend"] = np.where(df_copy["kama_diff"] > 0, 1, -1)
-
-    return df_copy["kama_trend"]
+    kama_trend = np.where(kama_fast - kama_slow > 0, 1, -1)
 
+    return pd.Series(kama_trend, index=df.index, name="kama_trend")
@@ -1,11 +1,148 @@
 import numpy as np
 import pandas as pd
-from numba import njit
-from typing import Tuple
+from numba import njit, prange, types
+from functools import lru_cache
+from typing import List, Tuple
+
+# Array types used in the explicit kernel signatures. Inputs are declared read-only so that
+# both writable arrays and the read-only views returned by pandas are accepted without a copy.
+_f8_1d_c = types.Array(types.float64, 1, "C", readonly=True)
+_f8_1d_a = types.Array(types.float64, 1, "A", readonly=True)
+_f8_2d_a = types.Array(types.float64, 2, "A", readonly=True)
+_f8_2d_c = types.Array(types.float64, 2, "C", readonly=True)
+_f4_1d_c = types.Array(types.float32, 1, "C", readonly=True)
+_f4_1d_a = types.Array(types.float32, 1, "A", readonly=True)
+_f4_2d_a = types.Array(types.float32, 2, "A", readonly=True)
+
+# LLVM fast-math flags used by the kernels of this module: everything fastmath=True enables
+# except the "no NaNs" and "no infs" assumptions, which would let LLVM fold away the NaN checks
+# and NaN propagation. Reassociation means results may differ from a strict left-to-right
+# evaluation in the last bits. _sma_loop is compiled without fast-math, since reassociation
+# would cancel its Kahan compensation.
+_FASTMATH_NAN_SAFE = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Smallest positive normal float64, used to guard divisions without branching
+_TINY = np.finfo(np.float64).tiny
+
+
+def _as_kernel_array(x: np.ndarray) -> np.ndarray:
+    """
+    Prepare an array for the Numba kernels, which are compiled for C-contiguous float32 and float64.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional array of values.
+
+    Returns
+    -------
+    np.ndarray
+        `x` itself when it is already a C-contiguous float32 or float64 array, otherwise a
+        C-contiguous copy (converted to float64 when the dtype is not float32/float64).
+    """
+    x = np.asarray(x)
+    dtype = x.dtype if x.dtype in (np.float32, np.float64) else np.float64
+    return np.ascontiguousarray(x, dtype=dtype)
+
+
+def _check_window(value: int, name: str = "window_size") -> None:
+    """
+    Check that a window length is a positive integer, as required by the Numba kernels.
+
+    Parameters
+    ----------
+    value : int
+        The window length to check.
+    name : str, optional
+        Name of the parameter, used in the error message (default is "window_size").
+
+    Raises
+    ------
+    ValueError
+        If `value` is not an integer (floats and booleans are rejected) or is lower than 1.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value < 1:
+        raise ValueError(f"{name} must be a positive integer.")
+
+
+@njit([types.float64[::1](_f8_1d_c, types.intp),
+       types.float64[::1](_f4_1d_c, types.intp)], cache=True)
+def _sma_loop(x: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Compute a rolling mean with a running sum using Numba.
+
+    Each new value is added to the sum and the value leaving the window is subtracted from it,
+    with Kahan compensation to limit the accumulation of rounding errors. Non-finite values (NaN,
+    inf, -inf) are counted instead of summed, so they never enter the running sum. As with Pandas'
+    rolling.mean, a window containing one of them gives a NaN.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional NumPy array of values.
+    window_size : int
+        The window size for computing the mean.
+
+    Returns
+    -------
+    np.ndarray
+        The rolling mean. The first (window_size - 1) entries are NaN.
+    """
+    n = len(x)
+    out = np.full(n, np.nan)
+    total = 0.0
+    compensation = 0.0
+    non_finite_count = 0
+
+    for i in range(n):
+        if not np.isfinite(x[i]):
+            non_finite_count += 1
+        else:
+            y = x[i] - compensation
+            t = total + y
+            compensation = (t - total) - y
+            total = t
+
+        if i >= window_size:
+            if not np.isfinite(x[i - window_size]):
+                non_finite_count -= 1
+            else:
+                y = -x[i - window_size] - compensation
+                t = total + y
+                compensation = (t - total) - y
+                total = t
+
+        if i >= window_size - 1 and non_finite_count == 0:
+            out[i] = total / window_size
+
+    return out
+
+
+def sma_np(x: np.ndarray, window_size: int = 30) -> np.ndarray:
+    """
+    Calculate the Simple Moving Average (SMA) of a NumPy array.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional NumPy array of values. float32 arrays are used as is, other dtypes are
+        converted to float64.
+    window_size : int, optional
+        The window size for computing the SMA (default is 30).
+
+    Returns
+    -------
+    np.ndarray
+        The SMA values. The first (window_size - 1) entries will be NaN due to insufficient data.
+    """
+    _check_window(window_size)
+
+    return _sma_loop(_as_kernel_array(x), window_size)
+
 
 def sma(df: pd.DataFrame, col: str, window_size: int = 30) -> pd.Series:
     """
-    Calculate the Simple Moving Average (SMA) using Pandas rolling.mean.
+    Calculate the Simple Moving Average (SMA) using a running-sum Numba kernel.
 
     Parameters
     ----------
@@ -26,13 +163,99 @@ def sma(df: pd.DataFrame, col: str, window_size: int = 30) -> pd.Series:
     if col not in df.columns:
         raise ValueError(f"The column '{col}' is not present in the DataFrame.")
 
-    # Compute the SMA using Pandas' rolling.mean()
-    sma_series = df[col].rolling(window=window_size).mean()
+    return pd.Series(sma_np(df[col].to_numpy(dtype=np.float64, copy=False), window_size),
+                     index=df.index, name=f"sma_{window_size}")
+
+
+@njit([types.float64[::1](_f8_1d_c, types.intp, types.intp, types.intp),
+       types.float64[::1](_f4_1d_c, types.intp, types.intp, types.intp)],
+      cache=True, fastmath=_FASTMATH_NAN_SAFE)
+def _kama_fused(close_values: np.ndarray, l1: int, l2: int, l3: int) -> np.ndarray:
+    """
+    Compute KAMA in a single pass over the close values using Numba.
+
+    The rolling sum of |close(i) - close(i-1)| is maintained incrementally, and the efficiency
+    ratio, the smoothing constant and the recursion are all updated per bar, so the only array
+    written is the output.
 
-    # Rename the series for clarity
-    sma_series.name = f"sma_{window_size}"
+    Parameters
+    ----------
+    close_values : np.ndarray
+        A one-dimensional NumPy array of close values.
+    l1 : int
+        Rolling window length for computing the efficiency ratio.
+    l2 : int
+        Parameter for the fastest EMA constant.
+    l3 : int
+        Parameter for the slowest EMA constant.
 
-    return sma_series
+    Returns
+    -------
+    np.ndarray
+        The KAMA values.
+    """
+    n = len(close_values)
+    kama_values = np.empty(n)
+    if n == 0:
+        return kama_values
+
+    fast = 2.0 / (l2 + 1)
+    slow = 2.0 / (l3 + 1)
+
+    # Set the initial KAMA value as the first close available
+    kama_prev = close_values[0]
+    kama_values[0] = kama_prev
+    vol_sum = 0.0
+
+    # While the efficiency ratio window is incomplete the ratio is 0, so the smoothing constant
+    # is the slowest one; only the rolling sum of the volatility has to be accumulated.
+    sc = slow * slow
+    for i in range(1, min(l1, n)):
+        vol_sum += abs(close_values[i] - close_values[i - 1])
+        kama_prev = kama_prev + sc * (close_values[i] - kama_prev)
+        kama_values[i] = kama_prev
+
+    # Once the window is complete the loop body has no branch: a flat window (vol_sum == 0)
+    # gives a 0 numerator, and the ratio is clamped to its theoretical [0, 1] range.
+    for i in range(l1, n):
+        vol_sum += abs(close_values[i] - close_values[i - 1])
+        er = min(abs(close_values[i] - close_values[i - l1]) / max(vol_sum, _TINY), 1.0)
+        sc = (er * (fast - slow) + slow) ** 2
+        kama_prev = kama_prev + sc * (close_values[i] - kama_prev)
+        kama_values[i] = kama_prev
+
+        # Drop the volatility leaving the window before the next bar
+        vol_sum -= abs(close_values[i - l1 + 1] - close_values[i - l1])
+
+    return kama_values
+
+
+def kama_np(x: np.ndarray, l1: int = 10, l2: int = 2, l3: int = 30) -> np.ndarray:
+    """
+    Calculate Kaufman's Adaptive Moving Average (KAMA) of a NumPy array.
+
+    See `kama` for the definition of the indicator.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional NumPy array of close values. float32 arrays are used as is, other dtypes are
+        converted to float64.
+    l1 : int, optional
+        Rolling window length for computing the efficiency ratio (default is 10).
+    l2 : int, optional
+        Parameter for the fastest EMA constant (default is 2).
+    l3 : int, optional
+        Parameter for the slowest EMA constant (default is 30).
+
+    Returns
+    -------
+    np.ndarray
+        The KAMA values.
+    """
+    _check_window(l1, "l1")
+
+    return _kama_fused(_as_kernel_array(x), l1, l2, l3)
 
 
 def kama(df: pd.DataFrame, col: str, l1: int = 10, l2: int = 2, l3: int = 30) -> pd.Series:
@@ -70,133 +293,209 @@ def kama(df: pd.DataFrame, col: str, l1: int = 10, l2: int = 2, l3: int = 30) ->
     if col not in df.columns:
         raise ValueError(f"Column '{col}' not found in DataFrame.")
 
-    # Convert the column to float for consistency
-    close_series = df[col].astype(float)
-    close_values = close_series.values
-    n = len(close_values)
-
-    # Calculate volatility.md: absolute difference between consecutive close values
-    vol = pd.Series(np.abs(close_series - close_series.shift(1)), index=close_series.index)
+    return pd.Series(kama_np(df[col].to_numpy(dtype=np.float64, copy=False), l1, l2, l3),
+                     index=df.index, name="kama")
 
-    # Efficiency ratio numerator: absolute difference between current close and close l1 periods ago
-    er_num = np.abs(close_series - close_series.shift(l1))
-    # Efficiency ratio denominator: rolling sum of volatility.md over a window of l1 periods
-    er_den = vol.rolling(window=l1, min_periods=l1).sum()
 
-    # Compute efficiency ratio; fill NaN (or division by zero) with 0
-    efficiency_ratio = (er_num / er_den).fillna(0)
-
-    # Compute the smoothing constant, converting the result to a NumPy array for fast access
-    sc = ((efficiency_ratio * (2.0 / (l2 + 1) - 2.0 / (l3 + 1)) + 2.0 / (l3 + 1)) ** 2).values
+@lru_cache(maxsize=32)
+def _x_moments(w: int) -> Tuple[float, float, float]:
+    """
+    Moments of the regressor x = [0, 1, ..., w - 1] of a rolling linear regression.
 
-    # Initialize an array to hold the KAMA values
-    kama_values = np.full(n, np.nan)
-    first_value = True
+    They only depend on the window size, so they are cached for repeated calls with the same `w`.
 
-    # Recursive calculation of KAMA
-    for i in range(n):
-        if np.isnan(sc[i]):
-            kama_values[i] = np.nan
-        elif first_value:
-            # Set the initial KAMA value as the first close available
-            kama_values[i] = close_values[i]
-            first_value = False
-        else:
-            kama_values[i] = kama_values[i - 1] + sc[i] * (close_values[i] - kama_values[i - 1])
+    Parameters
+    ----------
+    w : int
+        Length of the window.
 
-    return pd.Series(kama_values, index=df.index, name="kama")
+    Returns
+    -------
+    Tuple[float, float, float]
+        sum(x), sum(x^2) and w * sum(x^2) - sum(x)^2, the denominator of the least squares slope.
+    """
+    sum_x = w * (w - 1) / 2
+    sum_x2 = (w - 1) * w * (2 * w - 1) / 6
+    return sum_x, sum_x2, w * sum_x2 - sum_x ** 2
 
 
-@njit
-def _get_linear_regression_slope(series: np.ndarray) -> float:
+@njit([types.UniTuple(types.float64, 2)(_f8_1d_a, types.float64, types.float64, types.intp),
+       types.UniTuple(types.float64, 2)(_f4_1d_a, types.float64, types.float64, types.intp)],
+      fastmath=_FASTMATH_NAN_SAFE, cache=True)
+def _slope_r2(y: np.ndarray, sum_x: float, denom: float, w: int) -> Tuple[float, float]:
     """
-    Compute the slope of a linear regression line using a fast implementation with Numba.
+    Compute the slope of a linear regression and the R^2 of this locally fit line using a
+    fast implementation with Numba.
 
-    This function calculates the slope of the best-fit line through a 1D array of values
-    using the least squares method. It is optimized for performance using the @njit decorator from Numba.
+    The regressor is x = [0, 1, ..., w - 1], so its moments are passed in as constants and
+    the moments of y are accumulated in a single hand-written loop over the window. The sums
+    are always accumulated in float64, including for float32 inputs.
 
     Parameters
     ----------
-    series : np.ndarray
-        A one-dimensional NumPy array representing the input time series values.
+    y : np.ndarray
+        A one-dimensional NumPy array of length `w` representing the input time series values.
+    sum_x : float
+        Sum of x over the window.
+    denom : float
+        w * sum(x^2) - sum(x)^2, the denominator of the least squares slope.
+    w : int
+        Length of the window.
 
     Returns
     -------
-    float
-        The slope of the linear regression line fitted to the input series.
+    Tuple[float, float]
+        The slope and the R^2 of the regression line fitted to the input series.
 
     Notes
     -----
     This function is mainly used internally for rolling or local trend estimation.
     It is not intended to be called directly with a full DataFrame. Use it within a windowed operation.
     """
+    # Slope and R^2 are invariant to a shift of y: center on the first value of the window
+    # to keep the one-pass sums of squares well conditioned.
+    y0 = y[0]
+    sy = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for i in range(w):
+        yi = y[i] - y0
+        sy += yi
+        sxy += i * yi
+        syy += yi * yi
+
+    # The denominator only vanishes for a single-point window, whose slope is reported as 0
+    # (multiplying sy keeps NaN windows NaN)
+    slope = (w * sxy - sum_x * sy) / denom if denom > 0 else 0.0 * sy
+
+    # R^2 = 1 - SSR/SST, that is one minus the sum of squared residuals over the total sum of squares.
+    SST = syy - sy * sy / w
+    SSR = SST - slope * (sxy - sum_x * sy / w)
+
+    # A flat window (stale prices, halts) is perfectly fit by a constant line. The test is written
+    # so that a NaN SST (NaN in the window) still propagates to R^2.
+    if SST <= 1e-30:
+        return slope, 1.0
+
+    return slope, 1 - SSR / SST
+
+
+@njit([types.void(_f8_2d_a, types.float64, types.float64, types.float64[::1], types.float64[::1]),
+       types.void(_f4_2d_a, types.float64, types.float64, types.float64[::1], types.float64[::1])],
+      parallel=True, fastmath=_FASTMATH_NAN_SAFE, cache=True)
+def _slope_r2_kernel(windows: np.ndarray, sum_x: float, denom: float,
+                     slopes: np.ndarray, r2s: np.ndarray) -> None:
+    """
+    Compute the slope and the R^2 of a linear regression on every row of a 2D array of windows,
+    using a parallel Numba kernel.
 
-    n = len(series)
-    x = np.arange(n)
-    y = series
+    Windows are independent, so they are distributed across threads with `prange` (the number
+    of threads follows Numba's configuration, e.g. NUMBA_NUM_THREADS). Results are written into
+    the preallocated output arrays, with no reduction across windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A two-dimensional NumPy array of shape (n_windows, w), one window per row.
+    sum_x : float
+        Sum of x over a window.
+    denom : float
+        w * sum(x^2) - sum(x)^2, the denominator of the least squares slope.
+    slopes : np.ndarray
+        Output array of length n_windows receiving the slope of each window.
+    r2s : np.ndarray
+        Output array of length n_windows receiving the R^2 of each window.
 
-    sum_x = np.sum(x)
-    sum_y = np.sum(y)
-    sum_xy = np.sum(x * y)
-    sum_x2 = np.sum(x * x)
+    Notes
+    -----
+    This function is mainly used internally by `linear_slope_and_r2`.
+    """
+    m, w = windows.shape
 
-    numerator = n * sum_xy - sum_x * sum_y
-    denominator = n * sum_x2 - sum_x ** 2
+    for i in prange(m):
+        slopes[i], r2s[i] = _slope_r2(windows[i], sum_x, denom, w)
 
-    return numerator / denominator
 
-@njit
-def _get_linear_regression_slope_and_r2(series: np.ndarray) -> Tuple[float, float]:
+@njit(types.void(_f8_2d_c, types.intp, types.float64, types.float64, types.float64[:, ::1]),
+      parallel=True, fastmath=_FASTMATH_NAN_SAFE, cache=True)
+def _slope_multi_kernel(values: np.ndarray, w: int, sum_x: float, denom: float, slopes: np.ndarray) -> None:
     """
-    Compute the slope of a linear regression and the R^2 of this locally fit line using a
-    fast implementation with Numba.
+    Compute the rolling slope of a linear regression for several series at once, using a parallel
+    Numba kernel.
 
-    This function calculates the slope of the best-fit line through a 1D array of values
-    using the least squares method. It is optimized for performance using the @njit decorator from Numba.
-    The R^2 is then computed to quantify the goodness of a linear fit. Useful for tuning the window size,
-    and detectiong regions of local non-linearity.
+    Every (series, window) pair is independent, so all of them are distributed across threads
+    with a single `prange` loop. Each series is stored contiguously, so every window is read
+    from contiguous memory.
 
     Parameters
     ----------
-    series : np.ndarray
-        A one-dimensional NumPy array representing the input time series values.
-
-    Returns
-    -------
-    float
-        The slope of the linear regression line fitted to the input series.
+    values : np.ndarray
+        A two-dimensional NumPy array of shape (k, n), one series per row.
+    w : int
+        Length of the window.
+    sum_x : float
+        Sum of x over a window.
+    denom : float
+        w * sum(x^2) - sum(x)^2, the denominator of the least squares slope.
+    slopes : np.ndarray
+        Output array of shape (k, n), receiving at [j, i] the slope of the window of series j ending
+        at i. Each thread handles a run of consecutive windows of one series, so it writes into
+        contiguous memory.
 
     Notes
     -----
-    This function is mainly used internally for rolling or local trend estimation.
-    It is not intended to be called directly with a full DataFrame. Use it within a windowed operation.
+    This function is mainly used internally by `linear_slope` (with k = 1) and `linear_slope_multi`.
     """
+    k, n = values.shape
+    m = n - w + 1
+
+    for t in prange(k * m):
+        j = t // m
+        i = t % m
 
-    n = len(series)
-    x = np.arange(n)
-    y = series
+        # The slope is invariant to a shift of y: center on the first value of the window
+        y0 = values[j, i]
+        sy = 0.0
+        sxy = 0.0
+        for q in range(w):
+            yq = values[j, i + q] - y0
+            sy += yq
+            sxy += q * yq
 
-    sum_x = np.sum(x)
-    sum_y = np.sum(y)
-    sum_xy = np.sum(x * y)
-    sum_x2 = np.sum(x * x)
+        # The denominator only vanishes for a single-point window, whose slope is reported as 0
+        slopes[j, i + w - 1] = (w * sxy - sum_x * sy) / denom if denom > 0 else 0.0 * sy
 
 
-    numerator = n * sum_xy - sum_x * sum_y
-    denominator = n * sum_x2 - sum_x ** 2
+def linear_slope_np(x: np.ndarray, window_size: int = 60) -> np.ndarray:
+    """
+    Compute the slope of a linear regression line over a rolling window of a NumPy array.
 
-    slope = numerator / denominator
+    See `linear_slope` for details.
 
-    intercept = (sum_y - slope * sum_x) / n
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional NumPy array of values.
+    window_size : int, optional
+        Size of the rolling window used to fit the linear regression (default is 60).
 
-    y_pred = intercept + slope * x
+    Returns
+    -------
+    np.ndarray
+        The slope of the regression line at each time step. The first (window_size - 1) values are NaN.
+    """
+    _check_window(window_size)
 
-    # R^2 = SSR/SST, that is the sum squared residual over the total sum of squares.
-    SST = np.sum((y-np.mean(y))**2)
-    SSR = np.sum((y-y_pred)**2)
-    R2 = 1 - SSR/SST
+    # A single series of shape (1, n), processed by the same kernel as linear_slope_multi
+    values = np.ascontiguousarray(x, dtype=np.float64).reshape(1, -1)
+    n = values.shape[1]
+    slopes = np.full((1, n), np.nan)
 
-    return slope, R2
+    if n >= window_size:
+        sum_x, _, denom = _x_moments(window_size)
+        _slope_multi_kernel(values, window_size, sum_x, denom, slopes)
+
+    return slopes[0]
 
 
 def linear_slope(df: pd.DataFrame, col: str, window_size: int = 60) -> pd.Series:
@@ -204,8 +503,10 @@ def linear_slope(df: pd.DataFrame, col: str, window_size: int = 60) -> pd.Series
     Compute the slope of a linear regression line over a rolling window.
 
     This function applies a linear regression on a rolling window of a selected column,
-    returning the slope of the fitted line at each time step. It uses a fast internal implementation
-    (`_get_linear_regression_slope`) for efficient computation.
+    returning the slope of the fitted line at each time step. Since the regressor is always
+    x = [0, 1, ..., window_size - 1], the least squares slope is computed in closed form from
+    the sums of y and x * y over each window by a parallel Numba kernel. Each window is shifted by
+    its first value before summing, which keeps the result accurate for high price levels.
 
     Parameters
     ----------
@@ -227,18 +528,61 @@ def linear_slope(df: pd.DataFrame, col: str, window_size: int = 60) -> pd.Series
     This indicator is useful to assess short- or medium-term price trends.
     A positive slope indicates an upward trend, while a negative slope reflects a downward trend.
     """
-    lin_slope = df[col].rolling(window_size).apply(_get_linear_regression_slope, raw=True)
-    lin_slope.name = f"linear_slope_{window_size}"
-    return lin_slope
+    return pd.Series(linear_slope_np(df[col].to_numpy(dtype=np.float64, copy=False), window_size),
+                     index=df.index, name=f"linear_slope_{window_size}")
+
+
+def linear_slope_and_r2_np(x: np.ndarray, window_size: int = 60,
+                           dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the slope and R^2 of a linear regression line over a rolling window of a NumPy array.
+
+    See `linear_slope_and_r2` for details.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        A one-dimensional NumPy array of values.
+    window_size : int, optional
+        Size of the rolling window used to fit the linear regression (default is 60).
+    dtype : numpy.dtype, optional
+        Floating point type the values are read in by the kernel, np.float64 (default) or np.float32.
+        See `linear_slope_and_r2` for the precision limits of np.float32.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The slope and the R^2 of the regression line at each time step, as float64 arrays.
+        The first (window_size - 1) values are NaN.
+    """
+    _check_window(window_size)
+
+    if np.dtype(dtype) not in (np.float64, np.float32):
+        raise ValueError("dtype must be np.float64 or np.float32.")
+
+    values = np.ascontiguousarray(x, dtype=dtype)
+    n = len(values)
+    slopes = np.full(n, np.nan)
+    r2s = np.full(n, np.nan)
 
+    if n >= window_size:
+        sum_x, _, denom = _x_moments(window_size)
 
-def linear_slope_and_r2(df: pd.DataFrame, col: str, window_size: int = 60) -> pd.DataFrame:
+        # One row per window, without copying the data
+        windows = np.lib.stride_tricks.sliding_window_view(values, window_size)
+        _slope_r2_kernel(windows, sum_x, denom, slopes[window_size - 1:], r2s[window_size - 1:])
+
+    return slopes, r2s
+
+
+def linear_slope_and_r2(df: pd.DataFrame, col: str, window_size: int = 60,
+                        dtype: np.dtype = np.float64) -> pd.DataFrame:
     """
     Compute the slope and R^2 of a linear regression line over a rolling window.
 
     This function applies a linear regression on a rolling window of a selected column,
-    returning the slope and R^2 of the fitted line at each time step. It uses a fast internal implementation
-    (`_get_linear_regression_slope_and_r2`) for efficient computation.
+    returning the slope and R^2 of the fitted line at each time step. It uses a parallel Numba kernel
+    (`_slope_r2_kernel`) that computes both values in a single pass over each window.
 
     Parameters
     ----------
@@ -248,6 +592,13 @@ def linear_slope_and_r2(df: pd.DataFrame, col: str, window_size: int = 60) -> pd
         Name of the column on which to compute the slope.
     window_size : int, optional
         Size of the rolling window used to fit the linear regression (default is 60).
+    dtype : numpy.dtype, optional
+        Floating point type the column is read in, np.float64 (default) or np.float32.
+        np.float32 is not faster: on a single core it is measured slightly slower than float64,
+        and going through this function adds a cast copy of the column. The sums are still
+        accumulated in float64, but float32 rounds each price to steps of about |price| * 6e-8,
+        so the slope and R^2 become meaningless once per-bar moves approach that size (e.g. with
+        prices around 1e6 and moves of 0.01 the slope error is as large as the slope itself).
 
     Returns
     -------
@@ -262,25 +613,63 @@ def linear_slope_and_r2(df: pd.DataFrame, col: str, window_size: int = 60) -> pd
     A positive slope indicates an upward trend, while a negative slope reflects a downward trend.
     The R^2 indicator helps to quantify how good of a fit one has in the local region. This can be used as 
     a sort of confidence metric for the trend, or to detect regions of local non-linearity.
+    The kernel is compiled with fast-math reassociation, so values may differ from a textbook
+    two-pass computation in the last bits.
     """
-    df_trend_r2 = pd.DataFrame(index=df.index)
-    
-    # Create a numpy array from the values for better performance
-    values = df[col].values
-    n = len(values)
-    slopes = np.full(n, np.nan)
-    r2s = np.full(n, np.nan)
-    
-    # Calculate for each window manually, since apply + Numba will not play well 
-    # with a multi column return from .apply().
-    for i in range(window_size - 1, n):
-        window = values[i - window_size + 1:i + 1]
-        slope, r2 = _get_linear_regression_slope_and_r2(window)
-        slopes[i] = slope
-        r2s[i] = r2
-    
-    # Create the DataFrame columns
-    df_trend_r2[f"linear_slope_{window_size}"] = slopes
-    df_trend_r2[f"linear_r2_{window_size}"] = r2s
-    
-    return df_trend_r2
\ No newline at end of file
+    slopes, r2s = linear_slope_and_r2_np(df[col].to_numpy(dtype=dtype, copy=False), window_size, dtype)
+
+    # Build the DataFrame in one shot from the finished arrays
+    df_trend_r2 = pd.DataFrame({f"linear_slope_{window_size}": slopes, f"linear_r2_{window_size}": r2s},
+                               index=df.index, copy=False)
+
+    return df_trend_r2
+
+
+def linear_slope_multi(df: pd.DataFrame, cols: List[str], window_size: int = 60) -> pd.DataFrame:
+    """
+    Compute the slope of a linear regression line over a rolling window for several columns at once.
+
+    This is equivalent to calling `linear_slope` on each column, but the columns are converted
+    to a single NumPy array and processed by one parallel Numba kernel, which amortizes the
+    conversion, the x-moments and the kernel dispatch across all the columns.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input DataFrame containing the time series data.
+    cols : list of str
+        Names of the columns on which to compute the slope. A single column must still be passed
+        as a list, e.g. ['close'].
+    window_size : int, optional
+        Size of the rolling window used to fit the linear regression (default is 60).
+
+    Returns
+    -------
+    df_slopes : pandas.DataFrame
+        A DataFrame with one column "<col>_linear_slope_<window_size>" per input column, containing
+        the slope of the regression line at each time step.
+        The first (window_size - 1) values will be NaN due to insufficient data for the initial windows.
+        Index matches that of the input DataFrame, such that the columns can be directly joined.
+    """
+    _check_window(window_size)
+
+    # A string is iterable too, and would otherwise be read as a list of one-letter column names
+    if isinstance(cols, str):
+        raise ValueError("cols must be a list of column names, not a string.")
+
+    missing = [col for col in cols if col not in df.columns]
+    if missing:
+        raise ValueError(f"The columns {missing} are not present in the DataFrame.")
+
+    # One contiguous row per series, so that each window is a contiguous slice
+    values = np.ascontiguousarray(df[cols].to_numpy(dtype=np.float64, copy=False).T)
+    k, n = values.shape
+    slopes = np.full((k, n), np.nan)
+
+    if n >= window_size:
+        sum_x, _, denom = _x_moments(window_size)
+        _slope_multi_kernel(values, window_size, sum_x, denom, slopes)
+
+    # slopes.T is an (n, k) F-ordered view, used by the DataFrame without a copy
+    return pd.DataFrame(slopes.T, index=df.index, columns=[f"{col}_linear_slope_{window_size}" for col in cols],
+                        copy=False)